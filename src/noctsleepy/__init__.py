@@ -1,5 +1,17 @@
 """.. include:: ../../README.md"""  # noqa: D415
 
-from noctsleepy.main import compute_sleep_metrics
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from noctsleepy.main import compute_sleep_metrics
 
 __all__ = ["compute_sleep_metrics"]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import the processing pipeline, and with it Polars, on first access."""
+    if name == "compute_sleep_metrics":
+        from noctsleepy.main import compute_sleep_metrics
+
+        return compute_sleep_metrics
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,7 +7,7 @@ from typing import Annotated, List
 
 import typer
 
-from noctsleepy import main, timezones
+from noctsleepy import timezones
 
 app = typer.Typer(
     name="noctsleepy",
@@ -136,14 +136,14 @@ def compute_metrics(
     including sleep duration, continuity, and timing measures. Results are
     saved as a JSON file in the same directory as the input file.
     """
+    from noctsleepy import main
+
     main.compute_sleep_metrics(
         input_data=input_data,
         timezone=timezone,
         night_start=night_start,  # type: ignore[arg-type] #Covered by parse_time callback
         night_end=night_end,  # type: ignore[arg-type] #Covered by parse_time callback
         nw_threshold=nw_threshold,
-        selected_metrics=[metric.value for metric in selected_metrics]
-        if selected_metrics is not None
-        else None,
+        selected_metrics=selected_metrics,  # type: ignore[arg-type] #SleepMetricCategory members are str
         only_longest_sleep=longest_sleep,
     )
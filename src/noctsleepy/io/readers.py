@@ -36,19 +36,21 @@ def read_wristpy_data(filename: pathlib.Path) -> pl.DataFrame:
     ]
 
     if filename.suffix == ".csv":
-        try:
-            return pl.read_csv(filename, try_parse_dates=True, columns=required_columns)
-        except pl.exceptions.ColumnNotFoundError as e:
-            raise ValueError(f"Missing required columns in the data: {str(e)}") from e
-    if filename.suffix == ".parquet":
-        try:
-            return pl.read_parquet(filename, columns=required_columns)
-        except pl.exceptions.ColumnNotFoundError as e:
-            raise ValueError(f"Missing required columns in the data: {str(e)}") from e
-
-    raise ValueError(
-        (
-            f"Unsupported file format: {filename.suffix}. "
-            "Supported formats are .csv and .parquet."
+        lazy_data = pl.scan_csv(filename, try_parse_dates=True)
+    elif filename.suffix == ".parquet":
+        lazy_data = pl.scan_parquet(filename, parallel="row_groups")
+    else:
+        raise ValueError(
+            (
+                f"Unsupported file format: {filename.suffix}. "
+                "Supported formats are .csv and .parquet."
+            )
         )
-    )
+
+    missing_columns = set(required_columns) - set(lazy_data.collect_schema().names())
+    if missing_columns:
+        raise ValueError(
+            f"Missing required columns in the data: {sorted(missing_columns)}"
+        )
+
+    return lazy_data.select(required_columns).collect(engine="streaming")
@@ -1,10 +1,11 @@
 """Python based runner for noctscleepy."""
 
 import datetime
+import functools
 import itertools
 import json
 import pathlib
-from typing import Iterable, Literal, Optional
+from typing import Iterable, Literal, Optional, get_args
 
 import polars as pl
 
@@ -27,6 +28,29 @@ METRIC_MAPPING: dict[SLEEP_METRIC_CATEGORIES, list[str]] = {
     ],
 }
 
+_VALID_TIMEZONES = frozenset(get_args(timezones.CommonTimezones))
+
+_ALL_METRICS = tuple(itertools.chain.from_iterable(METRIC_MAPPING.values()))
+
+
+@functools.lru_cache(maxsize=None)
+def _metrics_for_categories(
+    categories: tuple[SLEEP_METRIC_CATEGORIES, ...],
+) -> tuple[str, ...]:
+    """Flatten metric categories into the metric names they contain.
+
+    Args:
+        categories: The requested metric categories, in order.
+
+    Returns:
+        The metric names of all requested categories, in order.
+    """
+    return tuple(
+        itertools.chain.from_iterable(
+            METRIC_MAPPING[category] for category in categories
+        )
+    )
+
 
 def compute_sleep_metrics(
     input_data: pathlib.Path | str,
@@ -82,17 +106,16 @@ def compute_sleep_metrics(
     Raises:
         ValueError: If the provided timezone is not valid.
     """
-    if timezone not in list(timezones.CommonTimezones.__args__):  # type: ignore[attr-defined] #Valid attribute for Literal
+    if timezone not in _VALID_TIMEZONES:
         raise ValueError(f"Invalid timezone: {timezone}")
     if night_start is None:
         night_start = datetime.time(hour=20, minute=0)
     if night_end is None:
         night_end = datetime.time(hour=8, minute=0)
-    output_file = pathlib.Path(input_data).with_name(
-        pathlib.Path(input_data).stem + "_sleep_metrics.json"
-    )
+    input_path = pathlib.Path(input_data)
+    output_file = input_path.with_name(input_path.stem + "_sleep_metrics.json")
 
-    data = readers.read_wristpy_data(pathlib.Path(input_data))
+    data = readers.read_wristpy_data(input_path)
     sleep_data = sleep_variables.SleepMetrics(
         data=data,
         night_start=night_start,
@@ -103,34 +126,28 @@ def compute_sleep_metrics(
     )
 
     if selected_metrics is None:
-        selected_metrics = ["sleep_duration", "sleep_continuity", "sleep_timing"]
-
-    metrics_to_compute = itertools.chain.from_iterable(
-        METRIC_MAPPING[metric] for metric in selected_metrics
-    )
+        metrics_to_compute = _ALL_METRICS
+    else:
+        metrics_to_compute = _metrics_for_categories(tuple(selected_metrics))
 
     sleep_metrics_dict = sleep_data.save_to_dict(metrics_to_compute)
 
     summary_stats = sleep_variables.extract_simple_statistics(sleep_data)
-    nights_metadata = sleep_data.night_data.unique(
-        subset=["night_date"], maintain_order=True
-    ).select(["night_date", "data_start_date"])
-
-    nights_metadata = nights_metadata.with_columns(
-        [
-            (
-                (pl.col("night_date") - pl.col("data_start_date")).dt.total_days() + 1
-            ).alias("night_number")
-        ]
+    nights_metadata = (
+        sleep_data.night_data.select(["night_date", "night_number"])
+        .unique(maintain_order=True)
+        .select(
+            pl.col("night_date").dt.strftime("%Y-%m-%d"),
+            pl.col("night_number").cast(pl.Utf8),
+        )
+        .to_dict(as_series=False)
     )
 
     output_file.write_text(
         json.dumps(
             {
-                "night_dates": nights_metadata["night_date"].cast(pl.Utf8).to_list(),
-                "night_numbers": nights_metadata["night_number"]
-                .cast(pl.Utf8)
-                .to_list(),
+                "night_dates": nights_metadata["night_date"],
+                "night_numbers": nights_metadata["night_number"],
                 "sleep_metrics": sleep_metrics_dict,
                 "summary_statistics": summary_stats,
             },
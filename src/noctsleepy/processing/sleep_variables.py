@@ -66,6 +66,7 @@ class SleepMetrics:
     _social_jetlag: Optional[float] = None
     _interdaily_stability: Optional[float] = None
     _interdaily_variability: Optional[float] = None
+    _nightly_aggregates: Optional[pl.DataFrame] = None
 
     def __init__(
         self,
@@ -109,7 +110,8 @@ class SleepMetrics:
         Raises:
             ValueError: If there are no valid nights in the data.
         """
-        self.sampling_time = data["time"].dt.time().diff()[1].total_seconds()
+        first_time, second_time = data["time"].head(2)
+        self.sampling_time = (second_time - first_time).total_seconds()
         self.night_data = _filter_nights(
             data, night_start, night_end, nw_threshold, timezone, self.sampling_time
         )
@@ -133,23 +135,7 @@ class SleepMetrics:
         thus it is a measure of the anatomical clock, not based on wall-clock time.
         """
         if self._sleep_duration is None:
-            self._sleep_duration = (
-                self.night_data.group_by("night_date")
-                .agg(
-                    [
-                        (
-                            pl.when(pl.col("spt_periods") & pl.col("sib_periods"))
-                            .then(1)
-                            .otherwise(0)
-                            .sum()
-                            * (self.sampling_time / 60)
-                        ).alias("sleep_duration"),
-                    ]
-                )
-                .sort("night_date")
-                .select("sleep_duration")
-                .to_series()
-            )
+            self._sleep_duration = self._compute_nightly_aggregates()["sleep_duration"]
         return self._sleep_duration
 
     @property
@@ -161,20 +147,69 @@ class SleepMetrics:
         anatomical clock, not wall-clock time.
         """
         if self._time_in_bed is None:
-            self._time_in_bed = (
-                self.night_data.group_by("night_date")
-                .agg(
-                    [
-                        (pl.col("spt_periods").sum() * (self.sampling_time / 60)).alias(
-                            "spt_count"
-                        ),
-                    ]
+            self._time_in_bed = self._compute_nightly_aggregates()["time_in_bed"]
+        return self._time_in_bed
+
+    def _compute_nightly_aggregates(self) -> pl.DataFrame:
+        """Compute all per-night aggregations in a single group_by.
+
+        Durations are summed over the whole night, awakenings are counted within
+        the SPT window and the onset/wakeup timestamps are taken from the sleep
+        periods. The onset/wakeup/midpoint columns are only computed when the data
+        has a sleep_status column and are null for nights without any sleep.
+
+        Returns:
+            A DataFrame with one row per night_date, in chronological order.
+        """
+        if self._nightly_aggregates is None:
+            minutes_per_sample = self.sampling_time / 60
+            sib_in_spt = pl.col("sib_periods").filter(pl.col("spt_periods"))
+            aggregations = [
+                (pl.col("spt_periods") & pl.col("sib_periods"))
+                .sum()
+                .alias("sleep_duration"),
+                pl.col("spt_periods").sum().alias("time_in_bed"),
+                pl.col("spt_periods").any().alias("has_spt"),
+                (sib_in_spt.shift(1) & ~sib_in_spt).sum().alias("num_awakenings"),
+            ]
+            derived_columns = [
+                pl.col(["sleep_duration", "time_in_bed"]) * minutes_per_sample,
+                pl.col("night_date").dt.weekday().alias("night_weekday"),
+            ]
+            if "sleep_status" in self.night_data.columns:
+                sleep_time = pl.col("local_time").filter(pl.col("sleep_status"))
+                aggregations += [
+                    sleep_time.min().alias("sleep_onset"),
+                    sleep_time.max().alias("sleep_wakeup"),
+                ]
+                derived_columns.append(
+                    _get_night_midpoint(
+                        pl.col("sleep_onset").dt.time(),
+                        pl.col("sleep_wakeup").dt.time(),
+                    ).alias("sleep_midpoint")
                 )
-                .sort("night_date")
-                .select("spt_count")
-                .to_series()
+            self._nightly_aggregates = (
+                self.night_data.lazy()
+                .group_by("night_date", maintain_order=True)
+                .agg(aggregations)
+                .with_columns(derived_columns)
+                .collect(engine="streaming")
             )
-        return self._time_in_bed
+        return self._nightly_aggregates
+
+    def _select_midpoints(self, days: Iterable[DayOfWeek | int]) -> pl.Series:
+        """Select the sleep midpoints of the nights falling on the given weekdays.
+
+        Args:
+            days: The weekdays (1=Monday, 7=Sunday) of the night dates to keep.
+
+        Returns:
+            The sleep midpoints of the selected nights with sleep.
+        """
+        return self._compute_nightly_aggregates().filter(
+            pl.col("sleep_midpoint").is_not_null(),
+            pl.col("night_weekday").is_in(list(days)),
+        )["sleep_midpoint"]
 
     @property
     def waso(self) -> pl.Series:
@@ -204,7 +239,9 @@ class SleepMetrics:
         the new local time after the clock change.
         """
         if self._sleep_onset is None:
-            self._sleep_onset = _compute_onset(self.night_data)
+            self._sleep_onset = (
+                self._compute_nightly_aggregates()["sleep_onset"].drop_nulls().dt.time()
+            )
         return self._sleep_onset
 
     @property
@@ -218,40 +255,29 @@ class SleepMetrics:
         the new local time after the clock change.
         """
         if self._sleep_wakeup is None:
-            self._sleep_wakeup = _compute_wakeup(self.night_data)
+            self._sleep_wakeup = (
+                self._compute_nightly_aggregates()["sleep_wakeup"]
+                .drop_nulls()
+                .dt.time()
+            )
         return self._sleep_wakeup
 
     @property
     def sleep_midpoint(self) -> pl.Series:
         """Calculate the midpoint of the sleep period in HH:MM format per night."""
         if self._sleep_midpoint is None:
-            self._sleep_midpoint = pl.Series(
-                name="sleep_midpoint",
-                values=[
-                    _get_night_midpoint(start, end)
-                    for start, end in zip(
-                        self.sleep_onset, self.sleep_wakeup, strict=True
-                    )
-                ],
-            )
+            self._sleep_midpoint = self._compute_nightly_aggregates()[
+                "sleep_midpoint"
+            ].drop_nulls()
         return self._sleep_midpoint
 
     @property
     def num_awakenings(self) -> pl.Series:
         """Calculate the number of awakenings during the sleep period."""
         if self._num_awakenings is None:
-            self._num_awakenings = (
-                self.night_data.filter(pl.col("spt_periods"))
-                .group_by("night_date")
-                .agg(
-                    (pl.col("sib_periods").cast(pl.Int8).diff().eq(-1).sum()).alias(
-                        "num_awakenings"
-                    )
-                )
-                .sort("night_date")
-                .select("num_awakenings")
-                .to_series()
-            )
+            self._num_awakenings = self._compute_nightly_aggregates().filter(
+                pl.col("has_spt")
+            )["num_awakenings"]
 
         return self._num_awakenings
 
@@ -271,23 +297,9 @@ class SleepMetrics:
     def weekday_midpoint(self) -> pl.Series:
         """Calculate the average sleep midpoint on weekdays in HH:MM format."""
         if self._weekday_midpoint is None:
-            weekday_data = self.night_data.filter(
-                pl.col("night_date").dt.weekday().is_in(list(self.weekdays))
+            self._weekday_midpoint = self._select_midpoints(self.weekdays).alias(
+                "weekday_midpoint"
             )
-            if weekday_data.is_empty():
-                self._weekday_midpoint = pl.Series(name="weekday_midpoint", values=[])
-            else:
-                weekday_onset = _compute_onset(weekday_data)
-                weekday_wakeup = _compute_wakeup(weekday_data)
-                self._weekday_midpoint = pl.Series(
-                    name="weekday_midpoint",
-                    values=[
-                        _get_night_midpoint(start, end)
-                        for start, end in zip(
-                            weekday_onset, weekday_wakeup, strict=True
-                        )
-                    ],
-                )
 
         return self._weekday_midpoint
 
@@ -295,23 +307,9 @@ class SleepMetrics:
     def weekend_midpoint(self) -> pl.Series:
         """Calculate the average sleep midpoint on weekends in HH:MM format."""
         if self._weekend_midpoint is None:
-            weekend_data = self.night_data.filter(
-                pl.col("night_date").dt.weekday().is_in(list(self.weekend))
+            self._weekend_midpoint = self._select_midpoints(self.weekend).alias(
+                "weekend_midpoint"
             )
-            if weekend_data.is_empty():
-                self._weekend_midpoint = pl.Series(name="weekend_midpoint", values=[])
-            else:
-                weekend_onset = _compute_onset(weekend_data)
-                weekend_wakeup = _compute_wakeup(weekend_data)
-                self._weekend_midpoint = pl.Series(
-                    name="weekend_midpoint",
-                    values=[
-                        _get_night_midpoint(start, end)
-                        for start, end in zip(
-                            weekend_onset, weekend_wakeup, strict=True
-                        )
-                    ],
-                )
 
         return self._weekend_midpoint
 
@@ -345,12 +343,9 @@ class SleepMetrics:
 
         def value_to_string(value: pl.Series | float) -> list[str] | str:
             if isinstance(value, pl.Series):
-                return [
-                    elem.strftime("%H:%M:%S")
-                    if isinstance(elem, datetime.time)
-                    else elem
-                    for elem in value
-                ]
+                if value.dtype == pl.Time:
+                    return value.dt.strftime("%H:%M:%S").to_list()
+                return value.to_list()
 
             return str(value)
 
@@ -391,7 +386,8 @@ def _filter_nights(
         sampling_time: The sampling time in seconds.
 
     Returns:
-        A Polars DataFrame containing only the valid nights.
+        A Polars DataFrame containing only the valid nights. The night_number
+            column counts nights from the first day of data collection.
 
     """
     min_date = data["time"].dt.date().min()
@@ -402,54 +398,63 @@ def _filter_nights(
     if utc_night_data["utc_offset_hours"].diff().cast(pl.Int8).eq(-1).any():
         utc_night_data = _fill_fall_back(utc_night_data, sampling_time)
 
-    if night_start > night_end:
-        nocturnal_sleep = utc_night_data.filter(
-            (pl.col("local_time").dt.time() >= night_start)
-            | (pl.col("local_time").dt.time() < night_end)
-        )
-        nocturnal_sleep = nocturnal_sleep.with_columns(
-            [
-                pl.when(pl.col("local_time").dt.time() >= night_start)
-                .then(pl.col("local_time").dt.date())
-                .otherwise(pl.col("local_time").dt.date() - pl.duration(days=1))
-                .alias("night_date")
-            ]
+    ns_per_day = 86_400 * 10**9
+    start_ns = _time_to_nanoseconds(night_start)
+    window_ns = (_time_to_nanoseconds(night_end) - start_ns) % ns_per_day
+
+    nocturnal_sleep = (
+        utc_night_data.lazy()
+        .with_columns(
+            pl.col("local_time").dt.time().to_physical().alias("_tod"),
+            pl.col("local_time").dt.date().alias("_date"),
+            pl.col(["spt_periods", "sib_periods", "nonwear_status"]).cast(pl.Boolean),
         )
-    else:
-        nocturnal_sleep = utc_night_data.filter(
-            (pl.col("local_time").dt.time() >= night_start)
-            & (pl.col("local_time").dt.time() < night_end)
+        .filter((pl.col("_tod") - start_ns) % ns_per_day < window_ns)
+        .with_columns(
+            (
+                pl.col("_date").cast(pl.Int32)
+                - (pl.col("_tod") < start_ns).cast(pl.Int32)
+            )
+            .cast(pl.Date)
+            .alias("night_date")
         )
+    )
+
+    nocturnal_sleep = nocturnal_sleep.filter(pl.col("night_date") >= min_date).filter(
+        pl.col("nonwear_status").mean().over("night_date") <= nw_threshold
+    )
+    if utc_night_data["local_time"].is_sorted():
         nocturnal_sleep = nocturnal_sleep.with_columns(
-            pl.col("local_time").dt.date().alias("night_date")
-        )
-    nocturnal_sleep = nocturnal_sleep.filter(pl.col("night_date") >= min_date)
-    night_stats = (
-        nocturnal_sleep.group_by("night_date")
-        .agg(
-            [
-                pl.col("nonwear_status").sum().alias("non_wear_count"),
-                pl.col("nonwear_status").count().alias("total_count"),
-            ]
+            pl.col("local_time").set_sorted()
         )
+    else:
+        nocturnal_sleep = nocturnal_sleep.sort("local_time")
+
+    return (
+        nocturnal_sleep.drop(["_tod", "_date"])
         .with_columns(
-            [
-                (pl.col("non_wear_count") / pl.col("total_count")).alias(
-                    "non_wear_percentage"
-                )
-            ]
+            pl.lit(min_date).alias("data_start_date"),
+            ((pl.col("night_date") - min_date).dt.total_days() + 1).alias(
+                "night_number"
+            ),
         )
+        .collect(engine="streaming")
     )
 
-    valid_nights = night_stats.filter(
-        pl.col("non_wear_percentage") <= nw_threshold
-    ).select(["night_date"])
 
-    filtered_nights = nocturnal_sleep.join(valid_nights, on="night_date").sort(
-        "local_time"
-    )
+def _time_to_nanoseconds(time: datetime.time) -> int:
+    """Convert a datetime.time object to nanoseconds since midnight.
 
-    return filtered_nights.with_columns([pl.lit(min_date).alias("data_start_date")])
+    This matches the physical representation of the Polars Time data type.
+
+    Args:
+        time: A datetime.time object.
+
+    Returns:
+        Nanoseconds since midnight as an integer.
+    """
+    seconds = time.hour * 3600 + time.minute * 60 + time.second
+    return (seconds * 10**6 + time.microsecond) * 1000
 
 
 def _convert_to_utc(data: pl.DataFrame, timezone: str) -> pl.DataFrame:
@@ -587,52 +592,27 @@ def _fill_fall_back(utc_data: pl.DataFrame, sampling_time: float) -> pl.DataFram
     return pl.concat([time_df_trimmed, data_df], how="horizontal")
 
 
-def _get_night_midpoint(start: datetime.time, end: datetime.time) -> datetime.time:
+def _get_night_midpoint(start: pl.Expr, end: pl.Expr) -> pl.Expr:
     """Calculate the midpoint of a nocturnal interval.
 
+    The times are truncated to whole seconds. If the end is before the start,
+    the interval is assumed to cross midnight.
+
     Args:
-        start: The start time of the nocturnal interval.
-        end: The end time of the nocturnal interval.
+        start: Expression for the start time of the nocturnal interval.
+        end: Expression for the end time of the nocturnal interval.
 
     Returns:
-        A datetime.time object representing the midpoint of the nocturnal interval.
+        An expression for the midpoint of the nocturnal interval, as a Time.
     """
-    start_s = start.hour * 3600 + start.minute * 60 + start.second
-    end_s = end.hour * 3600 + end.minute * 60 + end.second
-
-    if end_s < start_s:
-        end_s += 24 * 3600
+    ns_per_second = 10**9
+    seconds_per_day = 24 * 3600
+    start_s = start.to_physical() // ns_per_second
+    end_s = end.to_physical() // ns_per_second
+    end_s = end_s + pl.when(end_s < start_s).then(seconds_per_day).otherwise(0)
 
-    midpoint_s = (start_s + end_s) // 2
-
-    midpoint_hour = (midpoint_s % (24 * 3600)) // 3600
-    midpoint_minute = (midpoint_s % 3600) // 60
-    midpoint_second = midpoint_s % 60
-    return datetime.time(midpoint_hour, midpoint_minute, midpoint_second)
-
-
-def _compute_onset(df: pl.DataFrame) -> pl.Series:
-    return (
-        df.filter(pl.col("sleep_status"))
-        .group_by("night_date")
-        .agg(pl.col("local_time").min().alias("sleep_onset"))
-        .sort("night_date")
-        .select("sleep_onset")
-        .to_series()
-        .dt.time()
-    )
-
-
-def _compute_wakeup(df: pl.DataFrame) -> pl.Series:
-    return (
-        df.filter(pl.col("sleep_status"))
-        .group_by("night_date")
-        .agg(pl.col("local_time").max().alias("sleep_wakeup"))
-        .sort("night_date")
-        .select("sleep_wakeup")
-        .to_series()
-        .dt.time()
-    )
+    midpoint_s = (start_s + end_s) // 2 % seconds_per_day
+    return (midpoint_s * ns_per_second).cast(pl.Time)
 
 
 def _time_difference_abs_hours(time1: datetime.time, time2: datetime.time) -> float:
@@ -686,20 +666,30 @@ def extract_simple_statistics(
         {"name": "weekend_midpoint", "is_circular": True},
     )
 
-    for metric in metrics:
-        private_attr = f"_{metric['name']}"
-        if getattr(sleep_metrics, private_attr, None) is not None:
+    computed_metrics = [
+        metric
+        for metric in metrics
+        if getattr(sleep_metrics, f"_{metric['name']}", None) is not None
+    ]
+
+    linear_stats: list[pl.Expr] = []
+    for metric in computed_metrics:
+        if not metric["is_circular"]:
+            metric_values = pl.lit(getattr(sleep_metrics, metric["name"]))
+            linear_stats.append(metric_values.mean().alias(f"{metric['name']}_mean"))
+            linear_stats.append(metric_values.std().alias(f"{metric['name']}_sd"))
+    if linear_stats:
+        stats_dict.update(pl.select(linear_stats).row(0, named=True))
+
+    for metric in computed_metrics:
+        if metric["is_circular"]:
             metric_series = getattr(sleep_metrics, metric["name"])
-            if metric["is_circular"]:
-                stats_dict[f"{metric['name']}_mean"] = utils.compute_circular_mean_time(
-                    metric_series
-                )
-                stats_dict[f"{metric['name']}_sd"] = utils.compute_circular_sd_time(
-                    metric_series
-                )
-            else:
-                stats_dict[f"{metric['name']}_mean"] = metric_series.mean()
-                stats_dict[f"{metric['name']}_sd"] = metric_series.std()
+            stats_dict[f"{metric['name']}_mean"] = utils.compute_circular_mean_time(
+                metric_series
+            )
+            stats_dict[f"{metric['name']}_sd"] = utils.compute_circular_sd_time(
+                metric_series
+            )
 
     return stats_dict
 
@@ -1,21 +1,45 @@
 """Utility functions for extracting simple statistics from sleep metrics."""
 
 import datetime
+import math
 
 import numpy as np
 import polars as pl
 
+_RAD_PER_MIN = 2 * math.pi / 1440
+_MIN_PER_RAD = 1440 / (2 * math.pi)
 
-def _convert_time_to_minutes(datetime_obj: datetime.time) -> float:
-    """Convert a datetime.time object to minutes since midnight.
+_IS_SLEEP = pl.col("sleep_status")
+_CANDIDATE_SLEEP_BOUT = (
+    (
+        (
+            pl.col("night_date").diff().dt.total_days() != 0
+        )  # due to non-wear filtering this difference can be > 1
+        | (_IS_SLEEP & ~_IS_SLEEP.shift(1))
+    )
+    .cum_sum()
+    .alias("candidate_sleep_bout")
+)
+_SLEEP_BOUT_LENGTH = _IS_SLEEP.sum().over(["night_date", "candidate_sleep_bout"])
+_LONGEST_SLEEP_BOUT = (
+    pl.col("candidate_sleep_bout")
+    .filter(_IS_SLEEP)
+    .get(_SLEEP_BOUT_LENGTH.filter(_IS_SLEEP).arg_max())
+    .over("night_date")
+)
+
+
+def _convert_times_to_minutes(time_series: pl.Series) -> np.ndarray:
+    """Convert a series of time values to minutes since midnight.
 
     Args:
-        datetime_obj: A datetime.time object.
+        time_series: Polars Series containing datetime.time objects.
 
     Returns:
-        Minutes since midnight as a float.
+        Minutes since midnight as a float array, truncated to whole seconds.
     """
-    return datetime_obj.hour * 60 + datetime_obj.minute + datetime_obj.second / 60
+    seconds = time_series.to_physical().to_numpy() // 1_000_000_000
+    return seconds / 60
 
 
 def _convert_minutes_to_time(minutes: float) -> datetime.time:
@@ -27,13 +51,25 @@ def _convert_minutes_to_time(minutes: float) -> datetime.time:
     Returns:
         A datetime.time object.
     """
-    minutes = minutes % 1440
-    hours = int(minutes // 60)
-    mins = int(minutes % 60)
-    seconds = int((minutes % 1) * 60)
+    total_seconds = int(minutes % 1440 * 60) % 86400
+    hours, remainder = divmod(total_seconds, 3600)
+    mins, seconds = divmod(remainder, 60)
     return datetime.time(hours, mins, seconds)
 
 
+def _circular_moments(time_series: pl.Series) -> tuple[float, float, int]:
+    """Sum the sines and cosines of time values mapped onto the 24-hour circle.
+
+    Args:
+        time_series: Polars Series containing datetime.time objects.
+
+    Returns:
+        The sum of the sines, the sum of the cosines and the number of values.
+    """
+    angles = _RAD_PER_MIN * _convert_times_to_minutes(time_series)
+    return np.sin(angles).sum(), np.cos(angles).sum(), len(angles)
+
+
 def compute_circular_mean_time(datetime_series: pl.Series) -> datetime.time:
     """Calculate circular mean of time values.
 
@@ -47,20 +83,10 @@ def compute_circular_mean_time(datetime_series: pl.Series) -> datetime.time:
     Returns:
         Circular mean as a datetime.time object.
     """
-    radians_conversion = 2 * np.pi / 1440
-    minutes = [_convert_time_to_minutes(t) for t in datetime_series.to_list()]
-
-    angles = [radians_conversion * m for m in minutes]
-
-    sin_sum = sum(np.sin(angle) for angle in angles)
-    cos_sum = sum(np.cos(angle) for angle in angles)
+    sin_sum, cos_sum, _ = _circular_moments(datetime_series)
     mean_angle = np.arctan2(sin_sum, cos_sum)
 
-    mean_minutes = mean_angle / radians_conversion
-    if mean_minutes < 0:
-        mean_minutes += 1440
-
-    return _convert_minutes_to_time(mean_minutes)
+    return _convert_minutes_to_time(mean_angle * _MIN_PER_RAD)
 
 
 def compute_circular_sd_time(time_series: pl.Series) -> float:
@@ -72,22 +98,19 @@ def compute_circular_sd_time(time_series: pl.Series) -> float:
         time_series: Polars Series containing datetime.time objects.
 
     Returns:
-        Circular standard deviation in minutes.
+        Circular standard deviation in minutes, NaN if the series is empty.
     """
-    radian_conversion = 2 * np.pi / 1440
-    minutes = [_convert_time_to_minutes(t) for t in time_series.to_list()]
-
-    angles = [radian_conversion * m for m in minutes]
-    n = len(angles)
-    sin_sum = sum(np.sin(angle) for angle in angles)
-    cos_sum = sum(np.cos(angle) for angle in angles)
+    sin_sum, cos_sum, n = _circular_moments(time_series)
+    if n == 0:
+        return float("nan")
 
     r = np.sqrt(sin_sum**2 + cos_sum**2) / n
 
     if r < 1e-10:
         return float("inf")
 
-    circular_sd = np.sqrt(-2 * np.log(r)) / radian_conversion
+    # Rounding can push r slightly above 1 for identical times, clip to zero spread.
+    circular_sd = np.sqrt(np.clip(-2 * np.log(r), 0.0, None)) * _MIN_PER_RAD
 
     return circular_sd
 
@@ -102,9 +125,11 @@ def keep_longest_sleep_window(night_data: pl.DataFrame) -> pl.DataFrame:
     First, we count contiguous sleep bouts by creating a group identifier
     that increments whenever the sleep_status changes from awake to sleep, as well
     as when the night date changes (in case a window ends with sleep and the next
-    window also starts with sleep). We then group by night_date and find the longest
-    sleep bout. Finally, we filter the original night data to keep only the rows
-    corresponding to the longest sleep bout for each night_date.
+    window also starts with sleep). We then find the longest sleep bout within each
+    night_date, keeping the earliest one if several are equally long, and broadcast
+    it back to every row with a window expression. Finally, we filter the night data
+    to keep only the rows corresponding to the longest sleep bout for each
+    night_date.
 
     Args:
         night_data: DataFrame containing filtered night data with sleep_status column.
@@ -112,39 +137,10 @@ def keep_longest_sleep_window(night_data: pl.DataFrame) -> pl.DataFrame:
     Returns:
         DataFrame containing only the longest sleep window per night_date.
     """
-    night_data = night_data.with_columns(
-        [
-            (
-                (
-                    pl.col("night_date").diff().dt.total_days() != 0
-                )  # due to non-wear filtering this difference can be > 1
-                | (pl.col("sleep_status").cast(pl.Int8).diff() == 1)
-            )
-            .cum_sum()
-            .alias("candidate_sleep_bout")
-        ]
-    )
-
-    bout_lengths = (
-        night_data.filter(pl.col("sleep_status"))
-        .group_by(["night_date", "candidate_sleep_bout"])
-        .agg([pl.len().alias("bout_length")])
-    )
-
-    longest_bout_per_night_date = bout_lengths.group_by("night_date").agg(
-        [
-            pl.col("candidate_sleep_bout")
-            .sort_by("bout_length")
-            .last()
-            .alias("longest_bout")
-        ]
-    )
-
     return (
-        night_data.join(longest_bout_per_night_date, on="night_date")
-        .filter(
-            (pl.col("candidate_sleep_bout") == pl.col("longest_bout"))
-            & pl.col("sleep_status")
-        )
-        .drop(["candidate_sleep_bout", "longest_bout"])
+        night_data.lazy()
+        .with_columns(_CANDIDATE_SLEEP_BOUT)
+        .filter((pl.col("candidate_sleep_bout") == _LONGEST_SLEEP_BOUT) & _IS_SLEEP)
+        .drop("candidate_sleep_bout")
+        .collect(engine="streaming")
     )
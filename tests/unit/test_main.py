@@ -1,5 +1,6 @@
 """Test the main module of noctsleepy."""
 
+import json
 import pathlib
 
 import polars as pl
@@ -32,3 +33,24 @@ def test_bad_timezone(sample_csv_data: pathlib.Path) -> None:
     """Test that compute_sleep_metrics raises an error for an invalid timezone."""
     with pytest.raises(ValueError, match="Invalid timezone"):
         main.compute_sleep_metrics(sample_csv_data, timezone="fake timezone")
+
+
+def test_compute_sleep_metrics_selected(
+    sample_csv_data: pathlib.Path, tmp_path: pathlib.Path
+) -> None:
+    """Test that only the metrics of the selected categories are saved."""
+    input_file = tmp_path / sample_csv_data.name
+    input_file.write_bytes(sample_csv_data.read_bytes())
+
+    main.compute_sleep_metrics(
+        input_file,
+        timezone="America/New_York",
+        selected_metrics=["sleep_timing", "sleep_duration"],
+    )
+    output = json.loads(
+        (tmp_path / f"{input_file.stem}_sleep_metrics.json").read_text()
+    )
+
+    assert list(output["sleep_metrics"]) == (
+        main.METRIC_MAPPING["sleep_timing"] + main.METRIC_MAPPING["sleep_duration"]
+    )
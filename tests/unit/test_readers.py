@@ -22,6 +22,25 @@ def test_read_processed_data_csv(sample_csv_data: pathlib.Path) -> None:
     }
 
 
+def test_read_processed_data_parquet(
+    sample_csv_data: pathlib.Path, tmp_path: pathlib.Path
+) -> None:
+    """Test reading processed data from a Parquet file with extra columns."""
+    parquet_file = tmp_path / "example_data.parquet"
+    pl.read_csv(sample_csv_data, try_parse_dates=True).write_parquet(parquet_file)
+
+    parquet_data = read_wristpy_data(parquet_file)
+
+    assert isinstance(parquet_data, pl.DataFrame)
+    assert parquet_data.columns == [
+        "time",
+        "sleep_status",
+        "sib_periods",
+        "spt_periods",
+        "nonwear_status",
+    ]
+
+
 def test_file_not_found() -> None:
     """Test reading a non-existent file raises FileNotFoundError."""
     non_existent_file = pathlib.Path("non_existent_file.csv")
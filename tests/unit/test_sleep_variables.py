@@ -11,7 +11,7 @@ from noctsleepy import main
 from noctsleepy.processing import sleep_variables
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def create_dummy_data() -> pl.DataFrame:
     """Create a 1-day of dummy Polars DataFrame for testing."""
     dummy_date = datetime.datetime(year=2024, month=5, day=2, hour=10, minute=0)
@@ -81,6 +81,60 @@ def test_filter_nights_before_midnight(create_dummy_data: pl.DataFrame) -> None:
     assert time_check, "Not all timestamps are within the nocturnal interval"
 
 
+def test_filter_nights_after_midnight(create_dummy_data: pl.DataFrame) -> None:
+    """Test a nocturnal window that starts after midnight keeps its calendar date."""
+    night_start = datetime.time(hour=1, minute=0)
+    night_end = datetime.time(hour=9, minute=0)
+
+    valid_nights = sleep_variables._filter_nights(
+        create_dummy_data,
+        night_start,
+        night_end,
+        nw_threshold=0.2,
+        timezone="UTC",
+        sampling_time=60,
+    )
+
+    assert valid_nights["night_date"].unique().to_list() == [datetime.date(2024, 5, 3)]
+    assert valid_nights.height == 8 * 60
+
+
+def test_filter_nights_unsorted_input(create_dummy_data: pl.DataFrame) -> None:
+    """Test that unsorted input is returned in chronological order."""
+    valid_nights = sleep_variables._filter_nights(
+        create_dummy_data.reverse(),
+        night_start=datetime.time(hour=20, minute=0),
+        night_end=datetime.time(hour=8, minute=0),
+        nw_threshold=0.2,
+        timezone="UTC",
+        sampling_time=60,
+    )
+
+    assert valid_nights["local_time"].is_sorted()
+
+
+def test_filter_nights_integer_flags(create_dummy_data: pl.DataFrame) -> None:
+    """Test that 0/1 encoded period and non-wear columns are treated as Boolean."""
+    data = create_dummy_data.with_columns(
+        pl.col(["spt_periods", "sib_periods", "nonwear_status"]).cast(pl.Int32)
+    )
+
+    valid_nights = sleep_variables._filter_nights(
+        data,
+        night_start=datetime.time(hour=20, minute=0),
+        night_end=datetime.time(hour=8, minute=0),
+        nw_threshold=0.2,
+        timezone="UTC",
+        sampling_time=60,
+    )
+
+    assert (
+        valid_nights.select(["spt_periods", "sib_periods", "nonwear_status"]).dtypes
+        == [pl.Boolean] * 3
+    )
+    assert valid_nights["night_date"].unique().len() == 1
+
+
 def test_filter_nights_sleep_from_before_data_collection() -> None:
     """Test finding valid nights when sleep starts before data collection."""
     dummy_date = datetime.datetime(year=2024, month=5, day=2, hour=6, minute=0)
@@ -129,6 +183,10 @@ def test_filter_nights_sleep_from_before_data_collection() -> None:
         f"Expected {expected_night_numbers} "
         f"got {nights_metadata['night_number'].to_list()}"
     )
+    assert (
+        valid_nights["night_number"].unique(maintain_order=True).to_list()
+        == expected_night_numbers
+    )
 
 
 def test_sleepmetrics_class(create_dummy_data: pl.DataFrame) -> None:
@@ -139,6 +197,19 @@ def test_sleepmetrics_class(create_dummy_data: pl.DataFrame) -> None:
     assert metrics._time_in_bed is None, "time_in_bed should be None by default"
 
 
+def test_sleepmetrics_sampling_time_across_midnight(
+    create_dummy_data: pl.DataFrame,
+) -> None:
+    """Test the sampling time when the first two samples straddle midnight."""
+    data = create_dummy_data.with_columns(
+        pl.col("time") + datetime.timedelta(hours=13, minutes=59)
+    )
+
+    metrics = sleep_variables.SleepMetrics(data, timezone="UTC")
+
+    assert metrics.sampling_time == 60
+
+
 def test_sleepmetrics_no_valid_nights() -> None:
     """Test the SleepMetrics dataclass raises ValueError when no valid nights."""
     dummy_date = datetime.datetime(year=2024, month=5, day=2, hour=10, minute=0)
@@ -229,7 +300,9 @@ def test_get_night_midpoint() -> None:
     sleep_wakeup = datetime.time(hour=6, minute=10)
     expected_midpoint = datetime.time(hour=2, minute=5)
 
-    midpoint = sleep_variables._get_night_midpoint(sleep_onset, sleep_wakeup)
+    midpoint = pl.select(
+        sleep_variables._get_night_midpoint(pl.lit(sleep_onset), pl.lit(sleep_wakeup))
+    ).item()
 
     assert midpoint == expected_midpoint, (
         f"Expected midpoint {expected_midpoint}, got {midpoint}"
@@ -270,6 +343,29 @@ def test_num_awakenings_zero(create_dummy_data: pl.DataFrame) -> None:
     )
 
 
+def test_nights_without_sleep_are_skipped() -> None:
+    """Test that nights without sleep are skipped for the sleep timing metrics."""
+    dummy_date = datetime.datetime(year=2024, month=5, day=2, hour=10, minute=0)
+    dummy_datetime_list = [
+        dummy_date + datetime.timedelta(minutes=i) for i in range(2880)
+    ]
+    data = pl.DataFrame(
+        {
+            "time": dummy_datetime_list,
+            "sib_periods": [True] * 2880,
+            "spt_periods": [True] * 1440 + [False] * 1440,
+            "sleep_status": [True] * 1440 + [False] * 1440,
+            "nonwear_status": [False] * 2880,
+        }
+    )
+    metrics = sleep_variables.SleepMetrics(data, timezone="UTC")
+
+    assert len(metrics.sleep_duration) == 2
+    assert metrics.num_awakenings.to_list() == [0]
+    assert metrics.sleep_onset.to_list() == [datetime.time(hour=20)]
+    assert metrics.sleep_wakeup.to_list() == [datetime.time(hour=7, minute=59)]
+
+
 def test_waso_30() -> None:
     """Test the waso_30 attribute."""
     dummy_date = datetime.datetime(year=2024, month=5, day=2, hour=10, minute=0)
@@ -366,6 +462,36 @@ def test_social_jetlag() -> None:
     )
 
 
+def test_social_jetlag_across_midnight() -> None:
+    """Test the social jetlag when the midpoints fall on either side of midnight."""
+    dummy_date = datetime.datetime(year=2025, month=9, day=5, hour=10, minute=0)
+    dummy_datetime_list = [
+        dummy_date + datetime.timedelta(minutes=i) for i in range(3 * 1440)
+    ]
+    sleep_windows = [
+        (datetime.datetime(2025, 9, 5, 21, 50), datetime.datetime(2025, 9, 6, 1, 50)),
+        (datetime.datetime(2025, 9, 6, 22, 20), datetime.datetime(2025, 9, 7, 2, 20)),
+        (datetime.datetime(2025, 9, 7, 22, 20), datetime.datetime(2025, 9, 8, 2, 20)),
+    ]
+    sleep_status = [
+        any(start <= time < end for start, end in sleep_windows)
+        for time in dummy_datetime_list
+    ]
+    data = pl.DataFrame(
+        {
+            "time": dummy_datetime_list,
+            "sib_periods": [True] * len(dummy_datetime_list),
+            "spt_periods": [True] * len(dummy_datetime_list),
+            "sleep_status": sleep_status,
+            "nonwear_status": [False] * len(dummy_datetime_list),
+        }
+    )
+    metrics = sleep_variables.SleepMetrics(data, timezone="UTC")
+
+    assert metrics.weekday_midpoint.to_list() == [datetime.time(23, 49, 30)]
+    assert metrics.social_jetlag == pytest.approx(0.5, abs=1 / 60)
+
+
 @pytest.mark.parametrize(
     "time1, time2, expected_diff",
     [
@@ -1,7 +1,9 @@
 """Unit tests for the utils module."""
 
 import datetime
+import math
 
+import numpy as np
 import polars as pl
 import pytest
 
@@ -46,6 +48,10 @@ def test_compute_circular_mean_time(
             ),
             0,
         ),
+        (
+            pl.Series([datetime.time(1, 0), datetime.time(1, 0), datetime.time(1, 0)]),
+            0,
+        ),
         (
             pl.Series(
                 [datetime.time(23, 45), datetime.time(0, 0), datetime.time(0, 15)]
@@ -71,30 +77,39 @@ def test_compute_circular_sd_time(input_series: pl.Series, expected_sd: float) -
     assert sd_time == expected_sd
 
 
+def test_compute_circular_sd_time_empty() -> None:
+    """Test the compute_circular_sd_time function on an empty series."""
+    sd_time = utils.compute_circular_sd_time(pl.Series([], dtype=pl.Time))
+
+    assert math.isnan(sd_time)
+
+
 def test_longest_sleep() -> None:
     """Test the keep_longest_sleep_window function."""
     dummy_date = datetime.datetime(year=2024, month=5, day=2, hour=20, minute=0)
-    dummy_datetime_list = [
-        dummy_date + datetime.timedelta(minutes=i) for i in range(1440)
-    ]
+    dummy_times = pl.datetime_range(
+        dummy_date,
+        dummy_date + datetime.timedelta(minutes=1439),
+        interval="1m",
+        eager=True,
+    )
     longest_sleep_length = 500
     short_sleep_length = 120
+    sleep_mask = np.concatenate(
+        [
+            np.ones(longest_sleep_length, dtype=bool),
+            np.zeros(100, dtype=bool),
+            np.ones(short_sleep_length, dtype=bool),
+            np.zeros(720, dtype=bool),
+        ]
+    )
     data = pl.DataFrame(
         {
-            "time": dummy_datetime_list,
-            "sib_periods": [True] * longest_sleep_length
-            + [False] * 100
-            + [True] * short_sleep_length
-            + [False] * 720,
-            "spt_periods": [True] * longest_sleep_length
-            + [False] * 100
-            + [True] * short_sleep_length
-            + [False] * 720,
-            "sleep_status": [True] * longest_sleep_length
-            + [False] * 100
-            + [True] * short_sleep_length
-            + [False] * 720,
-            "nonwear_status": [False] * 1440,
+            "time": dummy_times,
+            "sib_periods": sleep_mask,
+            "spt_periods": sleep_mask,
+            "sleep_status": sleep_mask,
+            "nonwear_status": np.zeros(1440, dtype=bool),
         }
     )
     sleep_metrics_init = sleep_variables.SleepMetrics(data, timezone="UTC")
@@ -102,4 +117,40 @@ def test_longest_sleep() -> None:
     filtered_data = utils.keep_longest_sleep_window(sleep_metrics_init.night_data)
 
     assert filtered_data.shape[0] == longest_sleep_length - 1
-    assert all(filtered_data["sleep_status"])
+    assert filtered_data["sleep_status"].all()
+
+
+def test_longest_sleep_tie() -> None:
+    """Test that the earliest bout is kept when two bouts are equally long."""
+    dummy_date = datetime.datetime(year=2024, month=5, day=2, hour=20, minute=0)
+    dummy_times = pl.datetime_range(
+        dummy_date,
+        dummy_date + datetime.timedelta(minutes=1439),
+        interval="1m",
+        eager=True,
+    )
+    sleep_mask = np.concatenate(
+        [
+            np.zeros(10, dtype=bool),
+            np.ones(100, dtype=bool),
+            np.zeros(50, dtype=bool),
+            np.ones(100, dtype=bool),
+            np.zeros(1180, dtype=bool),
+        ]
+    )
+    data = pl.DataFrame(
+        {
+            "time": dummy_times,
+            "sib_periods": sleep_mask,
+            "spt_periods": sleep_mask,
+            "sleep_status": sleep_mask,
+            "nonwear_status": np.zeros(1440, dtype=bool),
+        }
+    )
+    sleep_metrics_init = sleep_variables.SleepMetrics(data, timezone="UTC")
+
+    filtered_data = utils.keep_longest_sleep_window(sleep_metrics_init.night_data)
+
+    assert filtered_data.shape[0] == 100
+    first_time = filtered_data["time"].dt.replace_time_zone(None)[0]
+    assert first_time == dummy_date + datetime.timedelta(minutes=10)